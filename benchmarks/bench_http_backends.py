@@ -0,0 +1,186 @@
+"""
+Compare the search HTTP backends against a local stub server.
+
+The stub speaks HTTP/1.1 (keep-alive) and HTTP/2 with prior knowledge
+(h2c) on the same port, and serves a small DuckDuckGo-like results page
+after an artificial delay. Each backend runs the same number of queries
+through ``SearchHandler`` with a thread pool, mirroring ``main.py``.
+
+Usage:
+    python benchmarks/bench_http_backends.py --queries 500 --workers 64
+
+Requires ``h2`` for the stub and ``httpx[http2]`` for the HTTP/2 backend.
+"""
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from handlers.http_transport import HttpxTransport, RequestsTransport  # noqa: E402
+from handlers.search_handler import SearchHandler  # noqa: E402
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+RESULT_PAGE = (
+    b"<html><body><div class='result'>"
+    b"<a class='result__a' href='https://www.linkedin.com/company/example/'>Example</a>"
+    b"</div></body></html>"
+)
+
+class StubServer:
+    """Local HTTP/1.1 + h2c server running on a background event loop."""
+
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+        self.connections = 0
+        self.port = 0
+        self._writers = set()
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        # Closing the sockets lets every connection handler return on EOF.
+        for writer in list(self._writers):
+            writer.close()
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=1024)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+            if head == H2_PREFACE:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_h1(head, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _serve_h1(self, head: bytes, reader, writer) -> None:
+        buffer = head
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            _, buffer = buffer.split(b"\r\n\r\n", 1)
+            await asyncio.sleep(self.delay_seconds)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+                b"Content-Length: " + str(len(RESULT_PAGE)).encode() + b"\r\n\r\n" + RESULT_PAGE
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, head: bytes, reader, writer) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        lock = asyncio.Lock()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.delay_seconds)
+            async with lock:
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "text/html"),
+                        ("content-length", str(len(RESULT_PAGE))),
+                    ],
+                )
+                conn.send_data(stream_id, RESULT_PAGE, end_stream=True)
+                writer.write(conn.data_to_send())
+                await writer.drain()
+
+        data = head
+        while data:
+            async with lock:
+                events = conn.receive_data(data)
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        asyncio.ensure_future(respond(event.stream_id))
+                writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+def run_backend(name: str, transport, url: str, queries: int, workers: int) -> float:
+    handler = SearchHandler(base_url=url, transport=transport)
+    companies = [f"Company {i}" for i in range(queries)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(handler.search_company, companies))
+    elapsed = time.perf_counter() - start
+    transport.close()
+
+    found = sum(1 for r in results if r.linkedin_url)
+    print(
+        f"{name:<10} {queries} queries in {elapsed:.2f}s "
+        f"({queries / elapsed:.1f} q/s), {found} hits"
+    )
+    return elapsed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark search HTTP backends.")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--delay", type=float, default=0.02, help="Stub latency in seconds.")
+    parser.add_argument("--h2-connections", type=int, default=2)
+    args = parser.parse_args()
+
+    server = StubServer(delay_seconds=args.delay)
+    server.start()
+    url = f"http://127.0.0.1:{server.port}/html"
+
+    try:
+        before = server.connections
+        run_backend("requests", RequestsTransport(), url, args.queries, args.workers)
+        print(f"{'':<10} sockets opened: {server.connections - before}")
+
+        before = server.connections
+        transport = HttpxTransport(max_connections=args.h2_connections, http1=False)
+        run_backend("httpx-h2", transport, url, args.queries, args.workers)
+        print(f"{'':<10} sockets opened: {server.connections - before}")
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import csv
 import json
 import logging
+import textwrap
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Dict, Iterable, List
+
+from utils.result_record import RESULT_FIELDS, ResultLike, as_result_dict
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,9 @@ class ExportHandler:
     """
     Handle exporting data to various formats.
     For this project tree we guarantee JSON and CSV.
+
+    Records may be plain mappings or ``CompanyResult`` objects; the latter
+    are turned into dicts one row at a time while writing.
     """
 
     def __init__(self, output_dir: Path) -> None:
@@ -18,24 +24,30 @@ class ExportHandler:
     def _ensure_output_dir(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _export_json(self, records: Iterable[Mapping[str, Any]]) -> Path:
+    def _export_json(self, records: Iterable[ResultLike]) -> Path:
         self._ensure_output_dir()
         output_path = self.output_dir / "results.json"
-        # Ensure list
-        data = list(records)
+        # Same layout as json.dump(list, indent=2), written row by row
         with output_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("[")
+            empty = True
+            for record in records:
+                f.write("\n" if empty else ",\n")
+                item = json.dumps(as_result_dict(record), ensure_ascii=False, indent=2)
+                f.write(textwrap.indent(item, "  "))
+                empty = False
+            f.write("]" if empty else "\n]")
         logger.info("Written JSON results to %s", output_path)
         return output_path
 
-    def _export_csv(self, records: Iterable[Mapping[str, Any]]) -> Path:
+    def _export_csv(self, records: Iterable[ResultLike]) -> Path:
         self._ensure_output_dir()
         output_path = self.output_dir / "results.csv"
 
-        rows: List[Mapping[str, Any]] = list(records)
+        rows: List[ResultLike] = list(records)
         if not rows:
             # still create an empty CSV with a standard header
-            header = ["companyName", "searchQuery", "linkedinUrl", "info", "timestamp"]
+            header = list(RESULT_FIELDS)
             with output_path.open("w", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=header)
                 writer.writeheader()
@@ -43,7 +55,7 @@ class ExportHandler:
             return output_path
 
         # Build header from keys union, but keep stable ordering for known keys
-        default_order = ["companyName", "searchQuery", "linkedinUrl", "info", "timestamp"]
+        default_order = list(RESULT_FIELDS)
         extra_keys = set()
         for row in rows:
             extra_keys.update(row.keys())
@@ -55,12 +67,12 @@ class ExportHandler:
             writer = csv.DictWriter(f, fieldnames=header)
             writer.writeheader()
             for row in rows:
-                writer.writerow(row)
+                writer.writerow(as_result_dict(row))
 
         logger.info("Written CSV results to %s", output_path)
         return output_path
 
-    def export(self, records: Iterable[Mapping[str, Any]], formats: Iterable[str]) -> Dict[str, Path]:
+    def export(self, records: Iterable[ResultLike], formats: Iterable[str]) -> Dict[str, Path]:
         """
         Export records to the specified formats.
 
@@ -0,0 +1,217 @@
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+class TransportError(Exception):
+    """
+    Raised by every transport for network/HTTP failures, so callers
+    don't need to know which client library is in use.
+    """
+
+class DnsCache:
+    """
+    In-process cache in front of ``socket.getaddrinfo``.
+
+    Entries expire after ``ttl_seconds``. Installing the cache patches
+    ``socket.getaddrinfo`` process-wide, which covers both ``requests``
+    (urllib3) and ``httpx`` (httpcore) without backend-specific hooks.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._original = None
+        self.hits = 0
+        self.misses = 0
+
+    def _resolve(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+
+        result = self._original(host, port, family, type, proto, flags)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (now + self.ttl_seconds, result)
+        return result
+
+    def install(self) -> None:
+        if self._original is not None:
+            return
+        self._original = socket.getaddrinfo
+        socket.getaddrinfo = self._resolve
+        logger.debug("DNS cache installed (ttl=%ss)", self.ttl_seconds)
+
+    def uninstall(self) -> None:
+        if self._original is None:
+            return
+        socket.getaddrinfo = self._original
+        self._original = None
+        with self._lock:
+            self._entries.clear()
+
+_dns_cache: Optional[DnsCache] = None
+_dns_cache_lock = threading.Lock()
+
+def enable_dns_cache(ttl_seconds: float) -> DnsCache:
+    """
+    Install the process-wide DNS cache (idempotent) and return it.
+    """
+    global _dns_cache
+    with _dns_cache_lock:
+        if _dns_cache is None:
+            _dns_cache = DnsCache(ttl_seconds)
+            _dns_cache.install()
+        else:
+            _dns_cache.ttl_seconds = ttl_seconds
+        return _dns_cache
+
+class RequestsTransport:
+    """
+    HTTP/1.1 transport built on ``requests``.
+
+    Each worker thread gets its own ``requests.Session`` so connections
+    are reused per thread (sessions are not safe to share across threads).
+    """
+
+    name = "requests"
+
+    def __init__(self, timeout_seconds: float = 10) -> None:
+        self.timeout_seconds = timeout_seconds
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def get(self, url: str, params: Dict[str, str], headers: Dict[str, str]) -> str:
+        try:
+            resp = self._session().get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout_seconds,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            raise TransportError(str(exc)) from exc
+        return resp.text
+
+    def close(self) -> None:
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+class HttpxTransport:
+    """
+    HTTP/2 transport built on ``httpx``.
+
+    A single thread-safe client is shared by all workers, so concurrent
+    queries to the same host are multiplexed as streams over a handful
+    of connections instead of one socket per thread.
+
+    Requires the optional ``httpx[http2]`` dependency.
+    """
+
+    name = "httpx"
+
+    def __init__(
+        self,
+        timeout_seconds: float = 10,
+        max_connections: int = 4,
+        http1: bool = True,
+        max_workers: int = 1,
+    ) -> None:
+        try:
+            import httpx
+            import h2  # noqa: F401  (httpx needs it for http2=True)
+        except ImportError as exc:
+            raise RuntimeError(
+                "The 'httpx' HTTP backend requires: pip install 'httpx[http2]'"
+            ) from exc
+
+        # httpx logs every request at INFO; keep per-company lines off stdout.
+        for name in ("httpx", "httpcore"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+        self._httpx = httpx
+        self.timeout_seconds = timeout_seconds
+        # http1=False forces HTTP/2 with prior knowledge (plain-text h2c),
+        # otherwise HTTP/2 is negotiated through TLS ALPN. If the host ends
+        # up speaking HTTP/1.1 there is one request per socket, so the pool
+        # must fit every worker or the rest time out waiting for a slot.
+        pool_size = max(1, int(max_connections))
+        if http1:
+            pool_size = max(pool_size, int(max_workers))
+        self.pool_size = pool_size
+        self._client = httpx.Client(
+            http1=http1,
+            http2=True,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,
+            ),
+        )
+
+    def get(self, url: str, params: Dict[str, str], headers: Dict[str, str]) -> str:
+        try:
+            resp = self._client.get(url, params=params, headers=headers)
+            resp.raise_for_status()
+        except self._httpx.HTTPError as exc:
+            raise TransportError(str(exc)) from exc
+        return resp.text
+
+    def close(self) -> None:
+        self._client.close()
+
+def build_transport(search_settings: Dict[str, Any]):
+    """
+    Build the HTTP transport selected by ``search.http_backend``.
+
+    Recognised settings:
+      - http_backend: "requests" (default) or "httpx"
+      - timeout_seconds
+      - dns_cache_ttl_seconds: 0 disables the in-process DNS cache
+      - http2_max_connections: connection cap for the httpx backend
+        (raised to max_workers so an HTTP/1.1 fallback can't starve workers)
+    """
+    backend = str(search_settings.get("http_backend", "requests")).lower()
+    timeout = search_settings.get("timeout_seconds", 10)
+
+    dns_ttl = float(search_settings.get("dns_cache_ttl_seconds", 0) or 0)
+    if dns_ttl > 0:
+        enable_dns_cache(dns_ttl)
+
+    if backend == "httpx":
+        return HttpxTransport(
+            timeout_seconds=timeout,
+            max_connections=search_settings.get("http2_max_connections", 4),
+            max_workers=search_settings.get("max_workers", 8),
+        )
+
+    if backend != "requests":
+        logger.warning(
+            "Unknown HTTP backend '%s'. Falling back to requests.",
+            backend,
+        )
+    return RequestsTransport(timeout_seconds=timeout)
@@ -1,10 +1,18 @@
 import logging
-from datetime import datetime
-from typing import Any, Dict
+import time
+from typing import Any, List, Optional
 
-import requests
 from bs4 import BeautifulSoup
 
+from handlers.http_transport import RequestsTransport, TransportError
+from utils.result_record import (
+    STATUS_FOUND,
+    STATUS_NOT_FOUND,
+    STATUS_SEARCH_ERROR,
+    STATUS_UNEXPECTED_ERROR,
+    CompanyResult,
+    build_search_query,
+)
 from utils.url_parser import is_valid_linkedin_company_url, normalize_linkedin_url
 
 logger = logging.getLogger(__name__)
@@ -15,12 +23,13 @@ class SearchHandler:
     via a public search engine (DuckDuckGo HTML endpoint by default).
     """
 
-    def __init__(self, base_url: str, timeout_seconds: int = 10) -> None:
+    def __init__(self, base_url: str, timeout_seconds: int = 10, transport: Optional[Any] = None) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
+        self.transport = transport or RequestsTransport(timeout_seconds=timeout_seconds)
 
     def build_query(self, company_name: str) -> str:
-        return f"linkedin company {company_name}"
+        return build_search_query(company_name)
 
     def _perform_search(self, query: str) -> str:
         """
@@ -37,73 +46,63 @@ class SearchHandler:
         }
         logger.debug("Requesting search for query: %s", query)
 
-        resp = requests.get(
-            self.base_url,
-            params=params,
-            headers=headers,
-            timeout=self.timeout_seconds,
-        )
-        resp.raise_for_status()
-        return resp.text
+        return self.transport.get(self.base_url, params=params, headers=headers)
 
-    def _extract_linkedin_url_from_html(self, html: str) -> str:
+    def _parse_candidate_links(self, html: str) -> List[str]:
         """
-        Parse HTML and find the first LinkedIn company URL.
+        Parse HTML and return hrefs that point at linkedin.com/company, in page order.
         """
         soup = BeautifulSoup(html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if "linkedin.com/company" in href:
-                if is_valid_linkedin_company_url(href):
-                    return normalize_linkedin_url(href)
+        return [
+            a["href"]
+            for a in soup.find_all("a", href=True)
+            if "linkedin.com/company" in a["href"]
+        ]
+
+    def _select_linkedin_url(self, candidates: List[str]) -> str:
+        """
+        Return the first valid candidate as a normalized LinkedIn company URL.
+        """
+        for href in candidates:
+            if is_valid_linkedin_company_url(href):
+                return normalize_linkedin_url(href)
         return ""
 
-    def search_company(self, company_name: str) -> Dict[str, Any]:
+    def _extract_linkedin_url_from_html(self, html: str) -> str:
+        """
+        Parse HTML and find the first LinkedIn company URL.
+        """
+        return self._select_linkedin_url(self._parse_candidate_links(html))
+
+    def search_company(self, company_name: str) -> CompanyResult:
         """
         High-level method to search for a single company and return
-        a structured result object as described in the README.
+        a compact result record (see ``CompanyResult.to_dict`` for the
+        exported shape described in the README).
         """
         query = self.build_query(company_name)
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = time.time()
 
         try:
             html = self._perform_search(query)
             linkedin_url = self._extract_linkedin_url_from_html(html)
-
-            if linkedin_url:
-                info = "LinkedIn page successfully found"
-            else:
-                info = "No LinkedIn company page found in search results"
+            status = STATUS_FOUND if linkedin_url else STATUS_NOT_FOUND
 
             logger.debug(
-                "Search result for '%s': url=%s info=%s", company_name, linkedin_url, info
+                "Search result for '%s': url=%s status=%d", company_name, linkedin_url, status
             )
 
-            return {
-                "companyName": company_name,
-                "searchQuery": query,
-                "linkedinUrl": linkedin_url,
-                "info": info,
-                "timestamp": timestamp,
-            }
+            return CompanyResult(company_name, linkedin_url, status, timestamp=timestamp)
 
-        except requests.RequestException as exc:
+        except TransportError as exc:
             logger.warning(
                 "Network/search error while processing '%s': %s", company_name, exc
             )
-            return {
-                "companyName": company_name,
-                "searchQuery": query,
-                "linkedinUrl": "",
-                "info": f"Search error: {exc}",
-                "timestamp": timestamp,
-            }
+            return CompanyResult(
+                company_name, status=STATUS_SEARCH_ERROR, detail=str(exc), timestamp=timestamp
+            )
         except Exception as exc:
             logger.exception("Unexpected error while searching for '%s': %s", company_name, exc)
-            return {
-                "companyName": company_name,
-                "searchQuery": query,
-                "linkedinUrl": "",
-                "info": f"Unexpected error: {exc}",
-                "timestamp": timestamp,
-            }
\ No newline at end of file
+            return CompanyResult(
+                company_name, status=STATUS_UNEXPECTED_ERROR, detail=str(exc), timestamp=timestamp
+            )
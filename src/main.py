@@ -1,15 +1,23 @@
 import argparse
+import heapq
+import itertools
 import json
 import logging
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from handlers.http_transport import build_transport
 from handlers.search_handler import SearchHandler
 from handlers.export_handler import ExportHandler
-from utils.data_cleaner import load_companies_from_file, dedupe_companies
+from utils.data_cleaner import dedupe_records
+from utils.disk_dedupe import dedupe_records_bounded
+from utils.input_reader import INPUT_FORMATS, InputRecord, iter_input_records
+from utils.log_pipeline import ProgressReporter, flush_rate_limit_filters, setup_logging_pipeline
+from utils.profiling import PROFILE_MODES, PipelineProfiler
+from utils.result_record import STATUS_UNEXPECTED_ERROR, CompanyResult
 from utils.url_parser import is_valid_linkedin_company_url
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -17,12 +25,16 @@ DEFAULT_INPUT_FILE = ROOT_DIR / "data" / "inputs" / "companies_list.txt"
 DEFAULT_OUTPUT_DIR = ROOT_DIR / "data" / "outputs"
 SETTINGS_FILE = ROOT_DIR / "src" / "config" / "settings.json"
 
-def setup_logging(level: str = "INFO") -> None:
+def setup_logging(
+    level: str = "INFO",
+    json_log: Optional[str] = None,
+    rate_limit: int = 20,
+) -> QueueListener:
     numeric_level = getattr(logging, level.upper(), logging.INFO)
-    logging.basicConfig(
+    return setup_logging_pipeline(
         level=numeric_level,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        json_log_path=Path(json_log) if json_log else None,
+        rate_limit=rate_limit,
     )
 
 def load_settings() -> Dict[str, Any]:
@@ -31,6 +43,9 @@ def load_settings() -> Dict[str, Any]:
             "base_url": "https://duckduckgo.com/html/",
             "timeout_seconds": 10,
             "max_workers": 8,
+            "http_backend": "requests",
+            "dns_cache_ttl_seconds": 0,
+            "http2_max_connections": 4,
         }
     }
 
@@ -61,7 +76,32 @@ def parse_args() -> argparse.Namespace:
         "--input",
         type=str,
         default=str(DEFAULT_INPUT_FILE),
-        help="Path to input companies list (one company per line).",
+        help="Path to input companies file (text, CSV/TSV, NDJSON or Parquet).",
+    )
+    parser.add_argument(
+        "--input-format",
+        type=str,
+        choices=INPUT_FORMATS,
+        default=None,
+        help="Input format (default: detected from the file extension, else text).",
+    )
+    parser.add_argument(
+        "--name-column",
+        type=str,
+        default=None,
+        help="Column/field holding the company name (tabular inputs).",
+    )
+    parser.add_argument(
+        "--id-column",
+        type=str,
+        default=None,
+        help="Column/field with a row ID, exported as 'rowId' on each result.",
+    )
+    parser.add_argument(
+        "--priority-column",
+        type=str,
+        default=None,
+        help="Numeric column/field; higher-priority companies are searched first.",
     )
     parser.add_argument(
         "--output-dir",
@@ -87,12 +127,64 @@ def parse_args() -> argparse.Namespace:
         default="INFO",
         help="Logging level (DEBUG, INFO, WARNING, ERROR).",
     )
+    parser.add_argument(
+        "--log-json",
+        type=str,
+        default=None,
+        help="Optional path for a structured JSON-lines copy of the log.",
+    )
+    parser.add_argument(
+        "--log-rate-limit",
+        type=int,
+        default=20,
+        help="Max log lines per message type per 10 seconds (0 disables; errors always pass).",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between aggregated progress lines.",
+    )
+    parser.add_argument(
+        "--dedupe-memory-mb",
+        type=float,
+        default=None,
+        help=(
+            "Use disk-backed deduplication whose in-memory state (Bloom filter "
+            "and write batch) is capped at this many MB. The unique records and "
+            "their results are still held in memory; use --limit for huge inputs."
+        ),
+    )
+    parser.add_argument(
+        "--dedupe-work-dir",
+        type=str,
+        default=None,
+        help="Directory for the disk-backed dedupe store (default: system temp).",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="Comma-separated profilers to run per pipeline stage (cprofile,sample).",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=None,
+        help="Directory for profiler output (default: <output-dir>/profile).",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=5.0,
+        help="Stack sampling interval in milliseconds.",
+    )
     return parser.parse_args()
 
-def validate_results(results: List[Dict[str, Any]]) -> None:
+def validate_results(results: List[CompanyResult]) -> None:
     """Log any results that don't contain a valid LinkedIn URL."""
     invalid = [
-        r for r in results if r.get("linkedinUrl") and not is_valid_linkedin_company_url(r["linkedinUrl"])
+        r for r in results if r.linkedin_url and not is_valid_linkedin_company_url(r.linkedin_url)
     ]
     if invalid:
         logging.warning(
@@ -100,10 +192,19 @@ def validate_results(results: List[Dict[str, Any]]) -> None:
             len(invalid),
         )
 
+def _priority_key(record: InputRecord) -> Tuple[bool, float]:
+    return (record.priority is not None, record.priority or 0.0)
+
 def main() -> None:
     args = parse_args()
-    setup_logging(args.log_level)
+    listener = setup_logging(args.log_level, json_log=args.log_json, rate_limit=args.log_rate_limit)
+    try:
+        run(args)
+    finally:
+        flush_rate_limit_filters()
+        listener.stop()
 
+def run(args: argparse.Namespace) -> None:
     settings = load_settings()
     search_settings = settings.get("search", {})
     logging.info("Loaded settings: %s", search_settings)
@@ -116,13 +217,52 @@ def main() -> None:
         logging.error("Input file does not exist: %s", input_path)
         sys.exit(1)
 
+    profiler: Optional[PipelineProfiler] = None
+    if args.profile:
+        modes = [m.strip().lower() for m in args.profile.split(",") if m.strip()]
+        unknown = set(modes) - set(PROFILE_MODES)
+        if unknown:
+            logging.error("Unsupported profile modes: %s", ", ".join(sorted(unknown)))
+            sys.exit(1)
+        profiler = PipelineProfiler(
+            modes,
+            output_dir=Path(args.profile_dir) if args.profile_dir else output_dir / "profile",
+            sample_interval_seconds=args.profile_interval / 1000.0,
+        )
+
     try:
-        companies = load_companies_from_file(input_path)
+        input_records = iter_input_records(
+            input_path,
+            input_format=args.input_format,
+            name_column=args.name_column,
+            id_column=args.id_column,
+            priority_column=args.priority_column,
+        )
+        if args.dedupe_memory_mb is not None:
+            unique = dedupe_records_bounded(
+                input_records,
+                memory_limit_mb=args.dedupe_memory_mb,
+                work_dir=Path(args.dedupe_work_dir) if args.dedupe_work_dir else None,
+            )
+            # Only the dedupe state is bounded: the unique records kept here
+            # (and their results) still live in memory for the search run.
+            if args.priority_column and args.limit is not None:
+                # Drain the stream keeping only the top-N by priority.
+                companies = heapq.nlargest(args.limit, unique, key=_priority_key)
+            elif args.priority_column:
+                companies = list(unique)
+            else:
+                companies = list(itertools.islice(unique, args.limit))
+            unique.close()
+        else:
+            companies = dedupe_records(input_records)
     except Exception as exc:
         logging.error("Failed to read companies from %s: %s", input_path, exc)
         sys.exit(1)
 
-    companies = dedupe_companies(companies)
+    if args.priority_column:
+        # Highest priority first; records without a priority go last.
+        companies.sort(key=_priority_key, reverse=True)
     if args.limit is not None:
         companies = companies[: args.limit]
 
@@ -132,47 +272,66 @@ def main() -> None:
 
     logging.info("Processing %d companies...", len(companies))
 
+    try:
+        transport = build_transport(search_settings)
+    except Exception as exc:
+        logging.error("Failed to set up HTTP backend: %s", exc)
+        sys.exit(1)
+
     search_handler = SearchHandler(
         base_url=search_settings.get("base_url", "https://duckduckgo.com/html/"),
         timeout_seconds=search_settings.get("timeout_seconds", 10),
+        transport=transport,
     )
-    results: List[Dict[str, Any]] = []
+    exporter = ExportHandler(output_dir=output_dir)
+
+    if profiler is not None:
+        profiler.instrument(search_handler, "_perform_search", "fetch")
+        profiler.instrument(search_handler, "_parse_candidate_links", "parse")
+        profiler.instrument(search_handler, "_select_linkedin_url", "score")
+        profiler.instrument(exporter, "export", "export")
+        profiler.start()
+
+    results: List[CompanyResult] = []
 
     # Use a thread pool for concurrent search
     max_workers = int(search_settings.get("max_workers", 8))
     max_workers = max(1, max_workers)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_company = {
-            executor.submit(search_handler.search_company, company): company
-            for company in companies
-        }
+    progress = ProgressReporter(total=len(companies), interval_seconds=args.progress_interval)
 
-        for future in as_completed(future_to_company):
-            company_name = future_to_company[future]
-            try:
-                result = future.result()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_record = {
+                executor.submit(search_handler.search_company, record.name): record
+                for record in companies
+            }
+
+            for future in as_completed(future_to_record):
+                record = future_to_record[future]
+                company_name = record.name
+                try:
+                    result = future.result()
+                    logging.debug(
+                        "Processed '%s' -> %s",
+                        company_name,
+                        result.linkedin_url or "NO RESULT",
+                    )
+                except Exception as exc:
+                    logging.exception("Unexpected error while processing '%s': %s", company_name, exc)
+                    result = CompanyResult(
+                        company_name, status=STATUS_UNEXPECTED_ERROR, detail=str(exc)
+                    )
+                if args.id_column:
+                    result.row_id = record.row_id
                 results.append(result)
-                logging.info(
-                    "Processed '%s' -> %s",
-                    company_name,
-                    result.get("linkedinUrl") or "NO RESULT",
-                )
-            except Exception as exc:
-                logging.exception("Unexpected error while processing '%s': %s", company_name, exc)
-                results.append(
-                    {
-                        "companyName": company_name,
-                        "searchQuery": search_handler.build_query(company_name),
-                        "linkedinUrl": "",
-                        "info": f"Unexpected error: {exc}",
-                        "timestamp": datetime.utcnow().isoformat() + "Z",
-                    }
-                )
+                progress.update(bool(result.linkedin_url))
+    finally:
+        transport.close()
 
+    progress.finish()
     validate_results(results)
 
-    exporter = ExportHandler(output_dir=output_dir)
     paths = exporter.export(results, formats=formats)
 
     if paths:
@@ -182,5 +341,10 @@ def main() -> None:
     else:
         logging.warning("No exports were generated. Check requested formats.")
 
+    if profiler is not None:
+        logging.info("Profile output:")
+        for path in profiler.stop():
+            logging.info("  %s", path)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,23 +1,25 @@
-thonimport csv
+import csv
 import json
 import logging
 from pathlib import Path
-from typing import Iterable, List, Mapping
+from typing import Iterable, List, Mapping, Union
 
 import openpyxl
 from openpyxl.workbook import Workbook
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 
+from utils.result_record import CompanyResult, as_result_dict
+
 logger = logging.getLogger(__name__)
 
-Record = Mapping[str, object]
+Record = Union[CompanyResult, Mapping[str, object]]
 
 def _ensure_parent_dir(path: Path) -> None:
     if path.parent and not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
 
-def _to_list(records: Iterable[Record]) -> List[Record]:
-    return list(records)
+def _to_list(records: Iterable[Record]) -> List[Mapping[str, object]]:
+    return [as_result_dict(rec) for rec in records]
 
 def export_json(records: Iterable[Record], output_path: Path) -> None:
     data = _to_list(records)
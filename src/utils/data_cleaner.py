@@ -1,6 +1,9 @@
+from dataclasses import replace
 from pathlib import Path
 from typing import Iterable, List
 
+from utils.input_reader import InputRecord, iter_input_records
+
 def clean_company_name(name: str) -> str:
     """
     Clean up a raw company name string:
@@ -30,19 +33,27 @@ def dedupe_companies(companies: Iterable[str]) -> List[str]:
         result.append(cleaned)
     return result
 
+def dedupe_records(records: Iterable[InputRecord]) -> List[InputRecord]:
+    """
+    Like ``dedupe_companies`` but for input records: names are cleaned and
+    the first record for each name (with its row ID/priority) is kept.
+    """
+    seen = set()
+    result: List[InputRecord] = []
+    for record in records:
+        cleaned = clean_company_name(record.name)
+        key = cleaned.lower()
+        if not cleaned:
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(replace(record, name=cleaned))
+    return result
+
 def load_companies_from_file(path: Path) -> List[str]:
     """
     Load company names from a text file, one company per line.
-    Blank lines are ignored.
+    Blank lines and lines starting with '#' are ignored.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {path}")
-
-    companies: List[str] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n")
-            if not line.strip():
-                continue
-            companies.append(line)
-    return companies
\ No newline at end of file
+    return [record.name for record in iter_input_records(path, input_format="text")]
@@ -0,0 +1,192 @@
+import hashlib
+import logging
+import math
+import shutil
+import sqlite3
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from utils.data_cleaner import clean_company_name
+from utils.input_reader import InputRecord
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over a ``bytearray``, using double hashing
+    from a single blake2b digest per key.
+    """
+
+    def __init__(self, size_bytes: int, num_hashes: int) -> None:
+        self.num_bits = max(8, size_bytes * 8)
+        self.num_hashes = max(1, num_hashes)
+        self._bits = bytearray(self.num_bits // 8)
+
+    def add(self, key: str) -> bool:
+        """Add ``key``; return True if it was possibly present already."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self._bits
+        num_bits = self.num_bits
+        present = True
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % num_bits
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return present
+
+class DiskDeduper:
+    """
+    Memory-bounded, order-preserving deduplication.
+
+    An in-memory Bloom filter answers "definitely new" for most keys;
+    only possible repeats are confirmed against an exact SQLite store on
+    disk. New keys are written in batches. ``memory_limit_mb`` is split
+    evenly between the Bloom filter and the SQLite page cache.
+    """
+
+    BATCH_SIZE = 10_000
+
+    def __init__(
+        self,
+        memory_limit_mb: float = 256,
+        work_dir: Optional[Path] = None,
+        expected_items: Optional[int] = None,
+    ) -> None:
+        budget = max(1, int(memory_limit_mb * 1024 * 1024))
+        bloom_bytes = budget // 2
+        # False positives only cost an extra SQLite lookup, so a few hashes
+        # are cheaper overall than the textbook optimum.
+        num_hashes = 4
+        if expected_items:
+            bits_per_item = bloom_bytes * 8 / expected_items
+            num_hashes = min(num_hashes, max(1, round(bits_per_item * math.log(2))))
+        self.bloom = BloomFilter(bloom_bytes, num_hashes)
+
+        self._tmp_dir = tempfile.mkdtemp(prefix="dedupe-", dir=str(work_dir) if work_dir else None)
+        self._conn = sqlite3.connect(str(Path(self._tmp_dir) / "seen.sqlite"))
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(f"PRAGMA cache_size=-{max(1, (budget - bloom_bytes) // 1024)}")
+        self._conn.execute("CREATE TABLE seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._batch: List[Tuple[str]] = []
+        self._batch_keys: Set[str] = set()
+
+        self.seen = 0
+        self.unique = 0
+        self.false_positives = 0
+        self.elapsed = 0.0
+
+    def add(self, key: str) -> bool:
+        """Record ``key``; return True if it had not been seen before."""
+        self.seen += 1
+        if self.bloom.add(key):
+            if key in self._batch_keys:
+                return False
+            cur = self._conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (key,))
+            if cur.rowcount == 0:
+                return False
+            self.false_positives += 1
+        else:
+            self._batch.append((key,))
+            self._batch_keys.add(key)
+            if len(self._batch) >= self.BATCH_SIZE:
+                self._flush()
+
+        self.unique += 1
+        return True
+
+    def _flush(self) -> None:
+        self._conn.executemany("INSERT INTO seen VALUES (?)", self._batch)
+        self._conn.commit()
+        self._batch.clear()
+        self._batch_keys.clear()
+
+    def _timed(self, items: Iterator[T]) -> Iterator[T]:
+        start = time.perf_counter()
+        try:
+            yield from items
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self.log_stats()
+
+    def dedupe(self, companies: Iterable[str]) -> Iterator[str]:
+        """
+        Streaming equivalent of ``dedupe_companies``: yields cleaned names
+        in input order, skipping blanks and case-insensitive repeats.
+        """
+        def unique() -> Iterator[str]:
+            for raw in companies:
+                cleaned = clean_company_name(raw)
+                if cleaned and self.add(cleaned.lower()):
+                    yield cleaned
+
+        return self._timed(unique())
+
+    def dedupe_records(self, records: Iterable[InputRecord]) -> Iterator[InputRecord]:
+        """Streaming equivalent of ``dedupe_records``."""
+        def unique() -> Iterator[InputRecord]:
+            for record in records:
+                cleaned = clean_company_name(record.name)
+                if cleaned and self.add(cleaned.lower()):
+                    yield replace(record, name=cleaned)
+
+        return self._timed(unique())
+
+    @property
+    def throughput(self) -> float:
+        return self.seen / self.elapsed if self.elapsed else 0.0
+
+    def log_stats(self) -> None:
+        logger.info(
+            "Deduplicated %d names to %d unique in %.2fs (%.0f names/s, %d Bloom false positives)",
+            self.seen,
+            self.unique,
+            self.elapsed,
+            self.throughput,
+            self.false_positives,
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def __enter__(self) -> "DiskDeduper":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+def dedupe_companies_bounded(
+    companies: Iterable[str],
+    memory_limit_mb: float = 256,
+    work_dir: Optional[Path] = None,
+    expected_items: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Memory-bounded variant of ``dedupe_companies`` for very large inputs.
+    Yields names lazily; the on-disk store is removed once exhausted.
+    """
+    with DiskDeduper(memory_limit_mb, work_dir=work_dir, expected_items=expected_items) as deduper:
+        yield from deduper.dedupe(companies)
+
+def dedupe_records_bounded(
+    records: Iterable[InputRecord],
+    memory_limit_mb: float = 256,
+    work_dir: Optional[Path] = None,
+    expected_items: Optional[int] = None,
+) -> Iterator[InputRecord]:
+    """
+    Memory-bounded variant of ``dedupe_records`` for very large inputs.
+    The limit covers the dedupe state only, not what the caller keeps.
+    """
+    with DiskDeduper(memory_limit_mb, work_dir=work_dir, expected_items=expected_items) as deduper:
+        yield from deduper.dedupe_records(records)
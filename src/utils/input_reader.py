@@ -0,0 +1,224 @@
+import csv
+import io
+import json
+import logging
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+INPUT_FORMATS = ("text", "csv", "tsv", "ndjson", "parquet")
+
+DEFAULT_NAME_COLUMNS = ("companyName", "company_name", "company", "name")
+
+_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+@dataclass
+class InputRecord:
+    name: str
+    row_id: Any = None
+    priority: Optional[float] = None
+
+def detect_format(path: Path) -> str:
+    """Guess the input format from the file extension (default: text)."""
+    return _SUFFIX_FORMATS.get(path.suffix.lower(), "text")
+
+def _to_priority(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _pick_name_column(columns: Sequence[str], name_column: Optional[str]) -> str:
+    if name_column:
+        if name_column not in columns:
+            raise ValueError(f"Name column '{name_column}' not found in input columns: {list(columns)}")
+        return name_column
+    lowered = {c.lower(): c for c in columns}
+    for candidate in DEFAULT_NAME_COLUMNS:
+        if candidate.lower() in lowered:
+            return lowered[candidate.lower()]
+    if not columns:
+        raise ValueError("Input has no columns")
+    return columns[0]
+
+def _check_column(column: Optional[str], columns: Sequence[str], label: str) -> None:
+    if column and column not in columns:
+        raise ValueError(f"{label} column '{column}' not found in input columns: {list(columns)}")
+
+def _iter_mmap_lines(path: Path) -> Iterator[bytes]:
+    """Yield raw lines from a memory-mapped file without reading it all in."""
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+def _iter_text(path: Path) -> Iterator[InputRecord]:
+    for raw in _iter_mmap_lines(path):
+        line = raw.decode("utf-8-sig").rstrip("\r\n")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        yield InputRecord(name=line)
+
+def _iter_csv(
+    path: Path,
+    delimiter: str,
+    name_column: Optional[str],
+    id_column: Optional[str],
+    priority_column: Optional[str],
+) -> Iterator[InputRecord]:
+    # utf-8-sig drops the BOM that Excel/CRM exports put before the header
+    with path.open("r", encoding="utf-8-sig", newline="", buffering=io.DEFAULT_BUFFER_SIZE * 16) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        name_col = _pick_name_column(header, name_column)
+        _check_column(id_column, header, "ID")
+        _check_column(priority_column, header, "Priority")
+
+        name_idx = header.index(name_col)
+        id_idx = header.index(id_column) if id_column else None
+        priority_idx = header.index(priority_column) if priority_column else None
+
+        for row in reader:
+            if len(row) <= name_idx or not row[name_idx].strip():
+                continue
+            yield InputRecord(
+                name=row[name_idx],
+                row_id=row[id_idx] if id_idx is not None and id_idx < len(row) else None,
+                priority=_to_priority(row[priority_idx]) if priority_idx is not None and priority_idx < len(row) else None,
+            )
+
+def _iter_ndjson(
+    path: Path,
+    name_column: Optional[str],
+    id_column: Optional[str],
+    priority_column: Optional[str],
+) -> Iterator[InputRecord]:
+    # Objects may omit keys, so a user-given column only has to appear in
+    # some object; anything never seen is reported once the file is read.
+    missing = {
+        label: column
+        for label, column in (("Name", name_column), ("ID", id_column), ("Priority", priority_column))
+        if column
+    }
+    seen_keys: Dict[str, None] = {}
+    for line_no, raw in enumerate(_iter_mmap_lines(path), start=1):
+        if not raw.strip():
+            continue
+        try:
+            obj: Dict[str, Any] = json.loads(raw.decode("utf-8-sig"))
+        except ValueError as exc:
+            logger.warning("Skipping invalid JSON on line %d of %s: %s", line_no, path, exc)
+            continue
+        if not isinstance(obj, dict):
+            logger.warning(
+                "Skipping invalid JSON on line %d of %s: expected an object, got %s",
+                line_no,
+                path,
+                type(obj).__name__,
+            )
+            continue
+        if not obj:
+            continue
+        if missing:
+            seen_keys.update(dict.fromkeys(obj))
+            for label, column in list(missing.items()):
+                if column in obj:
+                    del missing[label]
+        # Without --name-column, pick the default per object so files that
+        # mix e.g. "company" and "companyName" keys are read in full.
+        name = obj.get(name_column or _pick_name_column(list(obj), None))
+        if not isinstance(name, str) or not name.strip():
+            continue
+        yield InputRecord(
+            name=name,
+            row_id=obj.get(id_column) if id_column else None,
+            priority=_to_priority(obj.get(priority_column)) if priority_column else None,
+        )
+
+    if missing and seen_keys:
+        label, column = next(iter(missing.items()))
+        _check_column(column, list(seen_keys), label)
+
+def _iter_parquet(
+    path: Path,
+    name_column: Optional[str],
+    id_column: Optional[str],
+    priority_column: Optional[str],
+    chunk_size: int,
+) -> Iterator[InputRecord]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Reading Parquet input requires: pip install pyarrow") from exc
+
+    parquet_file = pq.ParquetFile(str(path), memory_map=True)
+    columns = parquet_file.schema_arrow.names
+    name_col = _pick_name_column(columns, name_column)
+    _check_column(id_column, columns, "ID")
+    _check_column(priority_column, columns, "Priority")
+
+    wanted: List[str] = [name_col]
+    for column in (id_column, priority_column):
+        if column and column not in wanted:
+            wanted.append(column)
+
+    # Only the selected columns are decoded, one row group batch at a time.
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=wanted):
+        data = batch.to_pydict()
+        ids = data.get(id_column) if id_column else None
+        priorities = data.get(priority_column) if priority_column else None
+        for i, name in enumerate(data[name_col]):
+            if not isinstance(name, str) or not name.strip():
+                continue
+            yield InputRecord(
+                name=name,
+                row_id=ids[i] if ids is not None else None,
+                priority=_to_priority(priorities[i]) if priorities is not None else None,
+            )
+
+def iter_input_records(
+    path: Path,
+    input_format: Optional[str] = None,
+    name_column: Optional[str] = None,
+    id_column: Optional[str] = None,
+    priority_column: Optional[str] = None,
+    chunk_size: int = 65536,
+) -> Iterator[InputRecord]:
+    """
+    Stream company records from a text, CSV/TSV, NDJSON or Parquet file.
+
+    Text files hold one company per line; blank lines and lines starting
+    with '#' are ignored. For tabular formats the name column defaults to
+    the first of companyName/company_name/company/name (else the first
+    column); ID and priority columns are optional.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {path}")
+
+    fmt = (input_format or detect_format(path)).lower()
+    if fmt == "text":
+        return _iter_text(path)
+    if fmt in ("csv", "tsv"):
+        delimiter = "\t" if fmt == "tsv" else ","
+        return _iter_csv(path, delimiter, name_column, id_column, priority_column)
+    if fmt == "ndjson":
+        return _iter_ndjson(path, name_column, id_column, priority_column)
+    if fmt == "parquet":
+        return _iter_parquet(path, name_column, id_column, priority_column, chunk_size)
+    raise ValueError(f"Unsupported input format: {input_format}")
@@ -0,0 +1,200 @@
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most ``max_per_interval`` records per message type
+    (logger, level, unformatted message) every ``interval_seconds``.
+
+    ERROR and above always pass, as do records logged with
+    ``extra={"rate_limit": False}``. When a window with suppressed records
+    ends, the next record of that type reports how many were dropped.
+    """
+
+    def __init__(self, max_per_interval: int = 20, interval_seconds: float = 10.0) -> None:
+        super().__init__()
+        self.max_per_interval = max_per_interval
+        self.interval_seconds = interval_seconds
+        # key -> [window_start, emitted, suppressed]
+        self._windows: Dict[Tuple[str, int, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR or not getattr(record, "rate_limit", True):
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval_seconds:
+                suppressed = int(window[2]) if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.max_per_interval:
+                window[1] += 1
+                suppressed = 0
+            else:
+                window[2] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar messages suppressed)"
+            record.args = None
+        return True
+
+    def flush(self) -> None:
+        """Log a summary for every window that still has suppressed records."""
+        with self._lock:
+            pending = [(key, int(window[2])) for key, window in self._windows.items() if window[2]]
+            for key, _ in pending:
+                self._windows[key][2] = 0
+
+        for (name, level, msg), suppressed in pending:
+            logging.getLogger(name).log(
+                level,
+                "%s (%d similar messages suppressed)",
+                msg,
+                suppressed,
+                extra={"rate_limit": False},
+            )
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records untouched.
+
+    The stock ``prepare`` formats the message on the calling thread and
+    drops ``exc_info``; here the listener's handlers do all formatting,
+    so worker threads only pay for the enqueue and the JSON sink still
+    sees the exception separately.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+def setup_logging_pipeline(
+    level: int = logging.INFO,
+    json_log_path: Optional[Path] = None,
+    rate_limit: int = 20,
+    rate_interval_seconds: float = 10.0,
+) -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue drained by a background writer.
+
+    Worker threads only enqueue records; formatting and writing to stdout
+    (and the optional JSON-lines file) happens on the listener thread.
+    The caller must ``stop()`` the returned listener to flush on exit.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers: List[logging.Handler] = [stdout_handler]
+
+    if json_log_path is not None:
+        json_log_path.parent.mkdir(parents=True, exist_ok=True)
+        json_handler = logging.FileHandler(json_log_path, encoding="utf-8")
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    queue_handler = DeferredQueueHandler(log_queue)
+    if rate_limit > 0:
+        queue_handler.addFilter(RateLimitFilter(rate_limit, rate_interval_seconds))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def flush_rate_limit_filters() -> None:
+    """
+    Emit pending suppression summaries from the root handlers' rate limit
+    filters. Call before stopping the listener so the last window's counts
+    are not lost at shutdown.
+    """
+    for handler in logging.getLogger().handlers:
+        for flt in handler.filters:
+            if isinstance(flt, RateLimitFilter):
+                flt.flush()
+
+class ProgressReporter:
+    """
+    Periodic aggregated progress lines (rate, ETA, hit ratio) instead of
+    one line per company. ``update`` is meant to be called from a single
+    thread, e.g. the ``as_completed`` loop in ``main.py``.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        interval_seconds: float = 5.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.total = total
+        self.interval_seconds = interval_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self.done = 0
+        self.hits = 0
+        self._start = time.monotonic()
+        self._last_report = self._start
+        self._reported_done: Optional[int] = None
+
+    def update(self, hit: bool) -> None:
+        self.done += 1
+        if hit:
+            self.hits += 1
+        now = time.monotonic()
+        if now - self._last_report >= self.interval_seconds:
+            self._last_report = now
+            self._report(now)
+
+    def finish(self) -> None:
+        # The last periodic line may already show the final count.
+        if self.done != self._reported_done:
+            self._report(time.monotonic())
+
+    def _report(self, now: float) -> None:
+        self._reported_done = self.done
+        elapsed = max(now - self._start, 1e-9)
+        rate = self.done / elapsed
+        remaining = self.total - self.done
+        eta = str(timedelta(seconds=int(remaining / rate))) if rate > 0 else "?"
+        self.logger.info(
+            "Progress: %d/%d (%.1f%%) | %.1f/s | hit ratio %.1f%% | ETA %s",
+            self.done,
+            self.total,
+            100.0 * self.done / self.total if self.total else 100.0,
+            rate,
+            100.0 * self.hits / self.done if self.done else 0.0,
+            eta,
+            extra={"rate_limit": False},
+        )
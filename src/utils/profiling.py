@@ -0,0 +1,238 @@
+import cProfile
+import functools
+import logging
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cprofile", "sample")
+
+# From 3.12 cProfile is built on process-wide sys.monitoring: one profile
+# can be active at a time and it records every thread's frames.
+PER_THREAD_CPROFILE = sys.version_info < (3, 12)
+
+class CProfileStages:
+    """
+    Deterministic profiling with cProfile.
+
+    Up to Python 3.11 cProfile only sees the thread that enabled it, so
+    every worker thread keeps its own ``Profile`` per stage; they are
+    merged into ``<stage>.pstats`` when written. On 3.12+ that split is
+    not possible, so a single profile covers the whole run and is written
+    to ``pipeline.pstats``; use the sampler for per-stage attribution.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._profiles: Dict[str, List[cProfile.Profile]] = {}
+        self._lock = threading.Lock()
+        self._global: Optional[cProfile.Profile] = None
+        self.skipped = 0
+
+    def _profile_for(self, name: str) -> cProfile.Profile:
+        profiles = getattr(self._local, "profiles", None)
+        if profiles is None:
+            profiles = self._local.profiles = {}
+        prof = profiles.get(name)
+        if prof is None:
+            prof = profiles[name] = cProfile.Profile()
+            with self._lock:
+                self._profiles.setdefault(name, []).append(prof)
+        return prof
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not PER_THREAD_CPROFILE:
+            yield
+            return
+        prof = self._profile_for(name)
+        try:
+            prof.enable()
+        except ValueError:
+            # Another profiler (e.g. an outer cProfile run) is active.
+            self.skipped += 1
+            yield
+            return
+        try:
+            yield
+        finally:
+            prof.disable()
+
+    def start(self) -> None:
+        if PER_THREAD_CPROFILE:
+            return
+        logger.warning(
+            "Python %d.%d profiles all threads with one cProfile; writing "
+            "pipeline.pstats without per-stage split (use --profile sample for stages).",
+            sys.version_info.major,
+            sys.version_info.minor,
+        )
+        self._global = cProfile.Profile()
+        self._global.enable()
+
+    def stop(self) -> None:
+        if self._global is not None:
+            self._global.disable()
+
+    def write(self, output_dir: Path) -> List[Path]:
+        paths: List[Path] = []
+        if self._global is not None:
+            path = output_dir / "pipeline.pstats"
+            pstats.Stats(self._global).dump_stats(str(path))
+            return [path]
+
+        for name, profiles in sorted(self._profiles.items()):
+            stats: Optional[pstats.Stats] = None
+            for prof in profiles:
+                try:
+                    if stats is None:
+                        stats = pstats.Stats(prof)
+                    else:
+                        stats.add(prof)
+                except TypeError:
+                    # Profile that never collected anything
+                    continue
+            if stats is None:
+                continue
+            path = output_dir / f"{name}.pstats"
+            stats.dump_stats(str(path))
+            paths.append(path)
+
+        if self.skipped:
+            logger.warning(
+                "cProfile skipped %d stage calls because another profiler was active.",
+                self.skipped,
+            )
+        return paths
+
+class StackSampler:
+    """
+    Low-overhead periodic stack sampler covering every thread.
+
+    A background thread snapshots ``sys._current_frames()`` every
+    ``interval_seconds`` and counts collapsed stacks, rooted at the
+    pipeline stage the sampled thread was in (or ``other``).
+    """
+
+    def __init__(self, interval_seconds: float = 0.005) -> None:
+        self.interval_seconds = interval_seconds
+        self.samples: Counter = Counter()
+        self._stages: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        ident = threading.get_ident()
+        previous = self._stages.get(ident)
+        self._stages[ident] = name
+        try:
+            yield
+        finally:
+            if previous is None:
+                self._stages.pop(ident, None)
+            else:
+                self._stages[ident] = previous
+
+    @staticmethod
+    def _frame_label(frame: Any) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            labels: List[str] = []
+            while frame is not None:
+                labels.append(self._frame_label(frame))
+                frame = frame.f_back
+            labels.append(self._stages.get(ident, "other"))
+            labels.reverse()
+            self.samples[";".join(labels)] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self, output_dir: Path) -> List[Path]:
+        path = output_dir / "samples.collapsed"
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return [path]
+
+class PipelineProfiler:
+    """
+    Switchable profiling for the fetch/parse/score/export pipeline stages.
+
+    Nothing here is touched unless ``--profile`` is given: stages are only
+    wrapped through ``instrument``, so a normal run keeps the original
+    methods and pays no overhead.
+    """
+
+    def __init__(
+        self,
+        modes: Iterable[str],
+        output_dir: Path,
+        sample_interval_seconds: float = 0.005,
+    ) -> None:
+        self.output_dir = output_dir
+        self.backends: List[Any] = []
+        for mode in modes:
+            if mode == "cprofile":
+                self.backends.append(CProfileStages())
+            elif mode == "sample":
+                self.backends.append(StackSampler(sample_interval_seconds))
+            else:
+                raise ValueError(f"Unsupported profile mode: {mode}")
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        with ExitStack() as stack:
+            for backend in self.backends:
+                stack.enter_context(backend.stage(name))
+            yield
+
+    def instrument(self, obj: Any, method_name: str, stage: str) -> None:
+        """Wrap ``obj.method_name`` (on the instance only) in ``stage``."""
+        method = getattr(obj, method_name)
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(stage):
+                return method(*args, **kwargs)
+
+        setattr(obj, method_name, wrapper)
+
+    def start(self) -> None:
+        for backend in self.backends:
+            backend.start()
+
+    def stop(self) -> List[Path]:
+        """Stop sampling and write all profiler output files."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        paths: List[Path] = []
+        for backend in self.backends:
+            backend.stop()
+            paths.extend(backend.write(self.output_dir))
+        return paths
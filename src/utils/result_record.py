@@ -0,0 +1,87 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+RESULT_FIELDS = ("companyName", "searchQuery", "linkedinUrl", "info", "timestamp")
+
+# Marks "no ID column requested"; None is a valid (missing) row ID value.
+NO_ROW_ID: Any = object()
+
+STATUS_FOUND = 0
+STATUS_NOT_FOUND = 1
+STATUS_SEARCH_ERROR = 2
+STATUS_UNEXPECTED_ERROR = 3
+
+# Index = status code; error statuses append the stored detail message.
+STATUS_INFO = (
+    "LinkedIn page successfully found",
+    "No LinkedIn company page found in search results",
+    "Search error: ",
+    "Unexpected error: ",
+)
+
+def build_search_query(company_name: str) -> str:
+    return f"linkedin company {company_name}"
+
+def format_timestamp(ts: float) -> str:
+    """Epoch seconds -> ISO-8601 UTC string with a trailing 'Z'."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+class CompanyResult:
+    """
+    Compact search result: a slotted record with a numeric status code and
+    an epoch timestamp. ``searchQuery``, ``info`` and the ISO timestamp are
+    derived only when the record is turned into a dict for export.
+    """
+
+    __slots__ = ("company_name", "linkedin_url", "status", "detail", "timestamp", "row_id")
+
+    def __init__(
+        self,
+        company_name: str,
+        linkedin_url: str = "",
+        status: int = STATUS_NOT_FOUND,
+        detail: Optional[str] = None,
+        timestamp: Optional[float] = None,
+        row_id: Any = NO_ROW_ID,
+    ) -> None:
+        self.company_name = company_name
+        self.linkedin_url = linkedin_url
+        self.status = status
+        self.detail = detail
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.row_id = row_id
+
+    @property
+    def info(self) -> str:
+        text = STATUS_INFO[self.status]
+        return text + self.detail if self.detail is not None else text
+
+    def keys(self) -> List[str]:
+        keys = list(RESULT_FIELDS)
+        if self.row_id is not NO_ROW_ID:
+            keys.append("rowId")
+        return keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "companyName": self.company_name,
+            "searchQuery": build_search_query(self.company_name),
+            "linkedinUrl": self.linkedin_url,
+            "info": self.info,
+            "timestamp": format_timestamp(self.timestamp),
+        }
+        if self.row_id is not NO_ROW_ID:
+            data["rowId"] = self.row_id
+        return data
+
+    def __repr__(self) -> str:
+        return f"CompanyResult({self.company_name!r}, {self.linkedin_url!r}, status={self.status})"
+
+ResultLike = Union[CompanyResult, Mapping[str, Any]]
+
+def as_result_dict(record: ResultLike) -> Mapping[str, Any]:
+    """Return ``record`` in the exported dict shape (mappings pass through)."""
+    if isinstance(record, CompanyResult):
+        return record.to_dict()
+    return record
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The application uses flat imports rooted at src/ (e.g. ``utils.data_cleaner``).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from utils.data_cleaner import dedupe_companies, dedupe_records
+from utils.disk_dedupe import DiskDeduper, dedupe_companies_bounded, dedupe_records_bounded
+from utils.input_reader import InputRecord
+
+def _names(count: int, distinct: int, seed: int = 1234):
+    rng = random.Random(seed)
+    names = []
+    for i in range(count):
+        n = rng.randrange(distinct)
+        # Vary case and whitespace so cleaning and case-folding matter.
+        names.append(f" Company  {n} " if i % 3 else f"company {n}")
+    names.extend(["", "   "])
+    return names
+
+@pytest.mark.parametrize("memory_limit_mb", [0.001, 0.05, 5])
+def test_bounded_dedupe_matches_in_memory(memory_limit_mb, tmp_path):
+    names = _names(30_000, 8_000)
+    result = list(dedupe_companies_bounded(names, memory_limit_mb=memory_limit_mb, work_dir=tmp_path))
+    assert result == dedupe_companies(names)
+
+def test_tiny_bloom_filter_still_exact(tmp_path):
+    # A saturated filter reports "maybe seen" for nearly every key, so
+    # exactness rests entirely on the SQLite store and the pending batch.
+    names = _names(DiskDeduper.BATCH_SIZE * 2 + 500, 6_000)
+    with DiskDeduper(memory_limit_mb=0.0001, work_dir=tmp_path) as deduper:
+        result = list(deduper.dedupe(names))
+        assert deduper.false_positives > 0
+    assert result == dedupe_companies(names)
+
+def test_bounded_record_dedupe_keeps_first_row(tmp_path):
+    records = [
+        InputRecord(" Acme ", row_id=1),
+        InputRecord("ACME", row_id=2),
+        InputRecord("Globex", row_id=3, priority=5.0),
+        InputRecord("", row_id=4),
+        InputRecord("acme", row_id=5),
+    ]
+    result = list(dedupe_records_bounded(records, memory_limit_mb=0.01, work_dir=tmp_path))
+    assert result == dedupe_records(records)
+    assert [(r.name, r.row_id) for r in result] == [("Acme", 1), ("Globex", 3)]
+
+def test_store_is_removed_after_exhaustion(tmp_path):
+    list(dedupe_companies_bounded(["a", "b", "a"], memory_limit_mb=1, work_dir=tmp_path))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,133 @@
+import logging
+import socket
+
+import pytest
+
+from handlers import http_transport
+from handlers.http_transport import DnsCache, RequestsTransport, build_transport
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeResolver:
+    def __init__(self) -> None:
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.calls.append((host, port, family, type, proto, flags))
+        if self.fail:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(http_transport.time, "monotonic", fake)
+    return fake
+
+@pytest.fixture
+def resolver(monkeypatch):
+    fake = FakeResolver()
+    monkeypatch.setattr(socket, "getaddrinfo", fake)
+    return fake
+
+@pytest.fixture
+def dns_cache(resolver, clock):
+    cache = DnsCache(ttl_seconds=60)
+    cache.install()
+    yield cache
+    cache.uninstall()
+
+def test_dns_cache_hit(dns_cache, resolver):
+    first = socket.getaddrinfo("example.com", 443)
+    second = socket.getaddrinfo("example.com", 443)
+    assert first == second
+    assert len(resolver.calls) == 1
+    assert (dns_cache.hits, dns_cache.misses) == (1, 1)
+
+def test_dns_cache_expires_after_ttl(dns_cache, resolver, clock):
+    socket.getaddrinfo("example.com", 443)
+    clock.now += 59
+    socket.getaddrinfo("example.com", 443)
+    assert len(resolver.calls) == 1
+    clock.now += 2
+    socket.getaddrinfo("example.com", 443)
+    assert len(resolver.calls) == 2
+
+def test_dns_cache_does_not_cache_errors(dns_cache, resolver):
+    resolver.fail = True
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            socket.getaddrinfo("missing.invalid", 443)
+    assert len(resolver.calls) == 2
+
+    resolver.fail = False
+    assert socket.getaddrinfo("missing.invalid", 443)
+
+def test_dns_cache_accepts_keyword_arguments(dns_cache, resolver):
+    socket.getaddrinfo("example.com", 443, type=socket.SOCK_STREAM)
+    socket.getaddrinfo("example.com", 443, 0, socket.SOCK_STREAM)
+    socket.getaddrinfo("example.com", 443, family=socket.AF_INET, type=socket.SOCK_STREAM)
+    assert resolver.calls == [
+        ("example.com", 443, 0, socket.SOCK_STREAM, 0, 0),
+        ("example.com", 443, socket.AF_INET, socket.SOCK_STREAM, 0, 0),
+    ]
+
+def test_uninstall_restores_resolver(resolver):
+    cache = DnsCache(ttl_seconds=60)
+    cache.install()
+    assert socket.getaddrinfo is not resolver
+    cache.uninstall()
+    assert socket.getaddrinfo is resolver
+
+def test_build_transport_defaults_to_requests():
+    transport = build_transport({})
+    assert isinstance(transport, RequestsTransport)
+    assert transport.timeout_seconds == 10
+
+def test_build_transport_unknown_backend_falls_back(caplog):
+    with caplog.at_level(logging.WARNING):
+        transport = build_transport({"http_backend": "curl", "timeout_seconds": 3})
+    assert isinstance(transport, RequestsTransport)
+    assert transport.timeout_seconds == 3
+    assert "Unknown HTTP backend 'curl'" in caplog.text
+
+def _httpx_transport():
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    return http_transport.HttpxTransport
+
+def test_build_transport_httpx_sizes_pool_for_workers():
+    _httpx_transport()
+    transport = build_transport(
+        {"http_backend": "httpx", "http2_max_connections": 4, "max_workers": 16}
+    )
+    try:
+        assert isinstance(transport, http_transport.HttpxTransport)
+        assert transport.pool_size == 16
+    finally:
+        transport.close()
+
+@pytest.mark.parametrize(
+    "max_connections, max_workers, http1, expected",
+    [(4, 8, True, 8), (4, 2, True, 4), (4, 64, False, 4), (0, 0, True, 1)],
+)
+def test_httpx_pool_sizing(max_connections, max_workers, http1, expected):
+    transport = _httpx_transport()(
+        max_connections=max_connections, max_workers=max_workers, http1=http1
+    )
+    try:
+        assert transport.pool_size == expected
+    finally:
+        transport.close()
+
+def test_httpx_transport_silences_request_logging():
+    transport = _httpx_transport()()
+    transport.close()
+    assert logging.getLogger("httpx").level == logging.WARNING
+    assert logging.getLogger("httpcore").level == logging.WARNING
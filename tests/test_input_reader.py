@@ -0,0 +1,81 @@
+import pytest
+
+from utils.data_cleaner import load_companies_from_file
+from utils.input_reader import iter_input_records
+
+def test_text_skips_blank_and_comment_lines(tmp_path):
+    path = tmp_path / "companies.txt"
+    path.write_text("\ufeff# header comment\nTesla\n\n  # indented comment\nGoogle\n", encoding="utf-8")
+    assert load_companies_from_file(path) == ["Tesla", "Google"]
+
+def test_csv_with_bom_header(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_bytes("\ufeffid,companyName,score\n7,Acme,3\n8,,1\n".encode("utf-8"))
+    records = list(iter_input_records(path, id_column="id", priority_column="score"))
+    assert [(r.name, r.row_id, r.priority) for r in records] == [("Acme", "7", 3.0)]
+
+def test_csv_bom_does_not_hide_default_name_column(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_bytes("\ufeffcompanyName,id\nAcme,1\n".encode("utf-8"))
+    assert [r.name for r in iter_input_records(path)] == ["Acme"]
+
+def test_ndjson_skips_non_object_lines(tmp_path):
+    path = tmp_path / "leads.ndjson"
+    path.write_text('[1, 2]\n{"company": "Acme", "id": 5}\nnot json\n"text"\n\n{"company": "Globex"}\n')
+    records = list(iter_input_records(path, id_column="id"))
+    assert [(r.name, r.row_id) for r in records] == [("Acme", 5), ("Globex", None)]
+
+def test_ndjson_default_name_column_is_picked_per_object(tmp_path):
+    path = tmp_path / "leads.ndjson"
+    path.write_text('{"company": "Acme"}\n{"companyName": "Globex"}\n{"name": "Initech", "id": 3}\n')
+    assert [r.name for r in iter_input_records(path)] == ["Acme", "Globex", "Initech"]
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"name_column": "compnay"}, "Name column 'compnay' not found"),
+        ({"id_column": "row"}, "ID column 'row' not found"),
+        ({"priority_column": "scroe"}, "Priority column 'scroe' not found"),
+    ],
+)
+def test_ndjson_unknown_column_raises(tmp_path, kwargs, message):
+    path = tmp_path / "leads.ndjson"
+    path.write_text('{"company": "Acme", "id": 1}\n{"company": "Globex", "score": 2}\n')
+    with pytest.raises(ValueError, match=message):
+        list(iter_input_records(path, **kwargs))
+
+def test_ndjson_column_present_in_some_objects_is_accepted(tmp_path):
+    path = tmp_path / "leads.ndjson"
+    path.write_text('{"company": "Acme"}\n{"company": "Globex", "score": "2.5"}\n')
+    records = list(iter_input_records(path, priority_column="score"))
+    assert [(r.name, r.priority) for r in records] == [("Acme", None), ("Globex", 2.5)]
+
+def _write_parquet(path, columns):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pq.write_table(pa.table(columns), str(path), row_group_size=2)
+
+def test_parquet_reads_selected_columns_across_batches(tmp_path):
+    path = tmp_path / "leads.parquet"
+    _write_parquet(
+        path,
+        {
+            "id": [1, 2, 3, 4, 5],
+            "company_name": ["Acme", "", None, "Globex", "Initech"],
+            "score": [1.0, 2.0, 3.0, None, 5.0],
+            "notes": ["a", "b", "c", "d", "e"],
+        },
+    )
+    records = list(iter_input_records(path, id_column="id", priority_column="score", chunk_size=2))
+    assert [(r.name, r.row_id, r.priority) for r in records] == [
+        ("Acme", 1, 1.0),
+        ("Globex", 4, None),
+        ("Initech", 5, 5.0),
+    ]
+
+def test_parquet_name_column_option_and_missing_column(tmp_path):
+    path = tmp_path / "leads.parquet"
+    _write_parquet(path, {"id": [1], "org": ["Acme"]})
+    assert [r.name for r in iter_input_records(path, name_column="org")] == ["Acme"]
+    with pytest.raises(ValueError, match="ID column 'row' not found"):
+        list(iter_input_records(path, name_column="org", id_column="row"))
@@ -0,0 +1,122 @@
+import json
+import logging
+from contextlib import contextmanager
+
+import pytest
+
+from utils import log_pipeline
+from utils.log_pipeline import (
+    ProgressReporter,
+    RateLimitFilter,
+    flush_rate_limit_filters,
+    setup_logging_pipeline,
+)
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def _record(msg: str, *args, level: int = logging.WARNING) -> logging.LogRecord:
+    return logging.LogRecord("search", level, __file__, 1, msg, args, None)
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(log_pipeline.time, "monotonic", fake)
+    return fake
+
+def test_rate_limit_window_and_suppressed_count(clock):
+    flt = RateLimitFilter(max_per_interval=3, interval_seconds=10.0)
+    passed = [flt.filter(_record("error for %s", i)) for i in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+
+    # Other message types have their own window.
+    assert flt.filter(_record("other message"))
+
+    clock.now += 10.0
+    record = _record("error for %s", 99)
+    assert flt.filter(record)
+    assert record.getMessage() == "error for 99 (7 similar messages suppressed)"
+
+    # The new window starts clean.
+    record = _record("error for %s", 100)
+    assert flt.filter(record)
+    assert record.getMessage() == "error for 100"
+
+def test_errors_and_opted_out_records_always_pass(clock):
+    flt = RateLimitFilter(max_per_interval=1, interval_seconds=10.0)
+    assert all(flt.filter(_record("boom", level=logging.ERROR)) for _ in range(5))
+    for _ in range(5):
+        record = _record("Progress")
+        record.rate_limit = False
+        assert flt.filter(record)
+
+@contextmanager
+def _pipeline(**kwargs):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    listener = setup_logging_pipeline(**kwargs)
+    try:
+        yield listener
+    finally:
+        listener.stop()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+        for handler in listener.handlers:
+            handler.close()
+
+def _json_messages(path):
+    return [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+def test_json_sink_keeps_exception_separate(tmp_path):
+    path = tmp_path / "log.jsonl"
+    with _pipeline(json_log_path=path):
+        try:
+            raise ValueError("bad input")
+        except ValueError:
+            logging.getLogger("worker").exception("Failed on %s", "Acme")
+
+    entry = json.loads(path.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["message"] == "Failed on Acme"
+    assert entry["level"] == "ERROR"
+    assert "ValueError: bad input" in entry["exc"]
+
+def test_flush_reports_last_window_at_shutdown(tmp_path, clock):
+    path = tmp_path / "log.jsonl"
+    with _pipeline(json_log_path=path, rate_limit=2):
+        for i in range(5):
+            logging.getLogger("search").warning("No result for %s", i)
+        flush_rate_limit_filters()
+        # Flushing twice must not repeat the summary.
+        flush_rate_limit_filters()
+
+    assert _json_messages(path) == [
+        "No result for 0",
+        "No result for 1",
+        "No result for %s (3 similar messages suppressed)",
+    ]
+
+def test_progress_finish_skips_repeated_line(clock, caplog):
+    logger = logging.getLogger("progress-test")
+    progress = ProgressReporter(total=2, interval_seconds=5.0, logger=logger)
+    with caplog.at_level(logging.INFO, logger="progress-test"):
+        progress.update(True)
+        clock.now += 5.0
+        progress.update(False)
+        progress.finish()
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith("Progress: 2/2 (100.0%)")
+
+def test_progress_finish_reports_unreported_work(clock, caplog):
+    logger = logging.getLogger("progress-test")
+    progress = ProgressReporter(total=3, interval_seconds=5.0, logger=logger)
+    with caplog.at_level(logging.INFO, logger="progress-test"):
+        progress.update(True)
+        progress.finish()
+    assert [r.getMessage()[:14] for r in caplog.records] == ["Progress: 1/3 "]
@@ -0,0 +1,41 @@
+import json
+import sys
+
+import pytest
+
+import main
+
+class FakeTransport:
+    def get(self, url, params, headers):
+        return "<html></html>"
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def run_cli(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "SETTINGS_FILE", tmp_path / "missing-settings.json")
+    monkeypatch.setattr(main, "build_transport", lambda settings: FakeTransport())
+
+    def run(*argv):
+        output_dir = tmp_path / "out"
+        monkeypatch.setattr(
+            sys, "argv", ["main.py", *argv, "--output-dir", str(output_dir), "--formats", "json"]
+        )
+        main.run(main.parse_args())
+        with (output_dir / "results.json").open(encoding="utf-8") as f:
+            return json.load(f)
+
+    return run
+
+@pytest.mark.parametrize("bounded", [False, True])
+def test_priority_is_applied_before_limit(tmp_path, run_cli, bounded):
+    path = tmp_path / "leads.csv"
+    path.write_text("company,id,score\nLow,1,1\nNone,2,\nTop,3,9\nLow,4,1\nMid,5,5\n")
+
+    argv = ["--input", str(path), "--id-column", "id", "--priority-column", "score", "--limit", "2"]
+    if bounded:
+        argv += ["--dedupe-memory-mb", "1", "--dedupe-work-dir", str(tmp_path)]
+    rows = run_cli(*argv)
+
+    assert sorted((r["companyName"], r["rowId"]) for r in rows) == [("Mid", "5"), ("Top", "3")]
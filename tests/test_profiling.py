@@ -0,0 +1,112 @@
+import logging
+import pstats
+import re
+import threading
+import time
+
+import pytest
+
+from utils import profiling
+from utils.profiling import PipelineProfiler
+
+THREADS = 4
+CALLS = 5
+
+class Worker:
+    def fetch(self, n: int = 2000) -> int:
+        return sum(i * i for i in range(n))
+
+    def parse(self, n: int = 2000) -> int:
+        return sum(i % 7 for i in range(n))
+
+    def spin(self, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.fetch(200)
+
+def _run_threads(target, count: int = THREADS) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def _call_count(path, func_name: str) -> int:
+    stats = pstats.Stats(str(path)).stats
+    return sum(nc for (_, _, name), (_, nc, *_rest) in stats.items() if name == func_name)
+
+@pytest.mark.skipif(not profiling.PER_THREAD_CPROFILE, reason="per-stage cProfile needs Python < 3.12")
+def test_cprofile_merges_threads_into_stage_files(tmp_path):
+    profiler = PipelineProfiler(["cprofile"], tmp_path)
+    worker = Worker()
+    profiler.instrument(worker, "fetch", "fetch")
+    profiler.instrument(worker, "parse", "parse")
+    profiler.start()
+
+    def work() -> None:
+        for _ in range(CALLS):
+            worker.fetch()
+            worker.parse()
+
+    _run_threads(work)
+    paths = profiler.stop()
+
+    assert sorted(p.name for p in paths) == ["fetch.pstats", "parse.pstats"]
+    # Every thread's profile is merged into the stage file.
+    assert _call_count(tmp_path / "fetch.pstats", "fetch") == THREADS * CALLS
+    assert _call_count(tmp_path / "fetch.pstats", "parse") == 0
+    assert _call_count(tmp_path / "parse.pstats", "parse") == THREADS * CALLS
+
+def test_cprofile_falls_back_to_pipeline_file(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(profiling, "PER_THREAD_CPROFILE", False)
+    profiler = PipelineProfiler(["cprofile"], tmp_path)
+    worker = Worker()
+    profiler.instrument(worker, "fetch", "fetch")
+
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        profiler.start()
+    worker.fetch()
+    paths = profiler.stop()
+
+    assert [p.name for p in paths] == ["pipeline.pstats"]
+    assert "without per-stage split" in caplog.text
+    assert _call_count(paths[0], "fetch") == 1
+    assert not (tmp_path / "fetch.pstats").exists()
+
+def test_sampler_writes_collapsed_stacks(tmp_path):
+    profiler = PipelineProfiler(["sample"], tmp_path, sample_interval_seconds=0.001)
+    worker = Worker()
+    profiler.instrument(worker, "spin", "fetch")
+    profiler.start()
+    _run_threads(lambda: worker.spin(0.2))
+    paths = profiler.stop()
+
+    assert [p.name for p in paths] == ["samples.collapsed"]
+    lines = paths[0].read_text(encoding="utf-8").splitlines()
+    assert lines
+
+    frame = re.compile(r"^\S+ \([^:()]+:\d+\)$")
+    fetch_stacks = 0
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        root, *frames = stack.split(";")
+        assert root in ("fetch", "other")
+        assert frames and all(frame.match(f) for f in frames)
+        if root == "fetch":
+            fetch_stacks += 1
+            assert any(f.startswith("spin (test_profiling.py:") for f in frames)
+    assert fetch_stacks
+
+def test_instrument_only_wraps_the_given_instance(tmp_path):
+    profiler = PipelineProfiler(["cprofile"], tmp_path)
+    profiled, plain = Worker(), Worker()
+    profiler.instrument(profiled, "fetch", "fetch")
+
+    assert "fetch" in vars(profiled)
+    assert "fetch" not in vars(plain)
+    assert plain.fetch.__func__ is Worker.fetch
+    assert profiled.fetch.__name__ == "fetch"
+
+    _run_threads(plain.fetch)
+    assert profiler.stop() == []
@@ -0,0 +1,68 @@
+import csv
+import json
+
+import pytest
+
+from handlers.export_handler import ExportHandler
+from utils.result_record import (
+    RESULT_FIELDS,
+    STATUS_FOUND,
+    STATUS_NOT_FOUND,
+    STATUS_SEARCH_ERROR,
+    CompanyResult,
+)
+
+def _results():
+    return [
+        CompanyResult("Tesla", "https://www.linkedin.com/company/tesla-motors", STATUS_FOUND, timestamp=0.0),
+        CompanyResult("Zürich Insurance", status=STATUS_NOT_FOUND, timestamp=1731320640.25),
+        CompanyResult("Acme", status=STATUS_SEARCH_ERROR, detail='timed out "q"\nretry', timestamp=5.5),
+    ]
+
+def test_to_dict_matches_previous_shape():
+    assert _results()[2].to_dict() == {
+        "companyName": "Acme",
+        "searchQuery": "linkedin company Acme",
+        "linkedinUrl": "",
+        "info": 'Search error: timed out "q"\nretry',
+        "timestamp": "1970-01-01T00:00:05.500000Z",
+    }
+
+def test_row_id_kept_when_requested_even_if_missing():
+    record = CompanyResult("Acme", row_id=None)
+    assert record.to_dict()["rowId"] is None
+    assert record.keys() == list(RESULT_FIELDS) + ["rowId"]
+    assert "rowId" not in CompanyResult("Acme").to_dict()
+
+def test_keys_returns_a_fresh_list():
+    CompanyResult("Acme").keys().append("mutated")
+    assert CompanyResult("Acme").keys() == list(RESULT_FIELDS)
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_json_export_matches_json_dump(tmp_path, count):
+    results = _results()[:count]
+    path = ExportHandler(tmp_path).export(results, formats=["json"])["json"]
+    expected = json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2)
+    assert path.read_text(encoding="utf-8") == expected
+
+def test_json_export_accepts_mixed_records(tmp_path):
+    results = [CompanyResult("Acme", row_id=None), {"companyName": "Legacy", "extra": [1, {"a": 2}]}]
+    path = ExportHandler(tmp_path).export(results, formats=["json"])["json"]
+    expected = json.dumps([results[0].to_dict(), results[1]], ensure_ascii=False, indent=2)
+    assert path.read_text(encoding="utf-8") == expected
+
+def test_csv_export_includes_row_id_column(tmp_path):
+    results = [CompanyResult("Acme", row_id="7"), CompanyResult("Globex", row_id=None)]
+    path = ExportHandler(tmp_path).export(results, formats=["csv"])["csv"]
+    with path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == list(RESULT_FIELDS) + ["rowId"]
+    assert [(r["companyName"], r["rowId"]) for r in rows] == [("Acme", "7"), ("Globex", "")]
+
+def test_data_exporter_accepts_company_results(tmp_path):
+    pytest.importorskip("openpyxl")
+    from outputs.data_exporter import export_data
+
+    path = tmp_path / "results.json"
+    export_data(_results(), path, "json")
+    assert json.loads(path.read_text(encoding="utf-8")) == [r.to_dict() for r in _results()]